@@ -4,19 +4,19 @@ Telegram Bot for Amharic Speech-to-Text Transcription.
 Receives audio messages and transcribes them using AWS Lambda API.
 """
 
-import base64
 import logging
 import os
-import random
+import sys
 import asyncio
+import weakref
 from datetime import datetime
-from typing import Optional
+from functools import lru_cache
 
 import httpx
 from dotenv import load_dotenv
 from urllib.parse import quote_plus
 
-from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
+from telegram import File, InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import (
     Application,
     CallbackQueryHandler,
@@ -26,6 +26,9 @@ from telegram.ext import (
     filters,
 )
 
+from fidelscribe.api import http_client, transcribe_audio
+from fidelscribe.i18n import DEFAULT_LANGUAGE, LANGUAGES, get_string, get_user_language
+
 # Load environment variables
 load_dotenv()
 
@@ -38,167 +41,47 @@ logger = logging.getLogger(__name__)
 
 # Configuration
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN")
-API_URL = "https://5pinlu85tk.execute-api.us-east-1.amazonaws.com/api/v1/speech-to-text"
 MAX_FILE_SIZE_MB = 10
 MAX_AUDIO_DURATION_SECONDS = 60
 
-# Retry configuration
-MAX_RETRIES = 3
-BASE_DELAY = 1  # seconds
+# Concurrency configuration
+MAX_CONCURRENT_PER_USER = 2  # Transcriptions a single user can run at once
+MAX_CONCURRENT_TRANSCRIPTIONS = 32  # Simultaneous API calls across all users
+# Weak values drop a user's semaphore once no handler is using it
+user_semaphores: weakref.WeakValueDictionary[int, asyncio.Semaphore] = weakref.WeakValueDictionary()
+transcription_semaphore = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIPTIONS)
+
+# Search button configuration
+GOOGLE_SEARCH_URL = "https://www.google.com/search?q="
+YOUTUBE_SEARCH_URL = "https://www.youtube.com/results?search_query="
+SEARCH_QUERY_LENGTH = 100  # Characters of the transcription used as the query
+
+# Parallel download configuration (small files are faster in one request)
+PARALLEL_DOWNLOAD_THRESHOLD = 2 * 1024 * 1024  # bytes
+DOWNLOAD_PARTS = 4  # Concurrent range requests per file
+
+# Separate client for Telegram file downloads so they don't share the API
+# client's connection pool and timeouts
+download_client = httpx.AsyncClient(timeout=httpx.Timeout(30.0, connect=10.0))
 
 # History configuration
 MAX_HISTORY_ITEMS = 10  # Maximum number of transcriptions to store per user
 PREVIEW_LENGTH = 50  # Characters to show in history preview
 
-# Language configurations
-LANGUAGES = {
-    "am": {
-        "code": "am-ET",
-        "flag": "🇪🇹",
-        "name_en": "Amharic",
-        "name_native": "አማርኛ",
-    },
-    "en": {
-        "code": "en-US",
-        "flag": "🇺🇸",
-        "name_en": "English",
-        "name_native": "English",
-    },
-}
-
-# UI Strings for both languages
-STRINGS = {
-    "am": {
-        "welcome": (
-            "🎤 *ወደ ፊደል ስክራይብ ቦት እንኳን በደህና መጡ!*\n\n"
-            "የድምጽ መልእክት ወይም የድምጽ ፋይል ይላኩልኝ፣ ወደ ጽሑፍ እቀይረዋለሁ።\n\n"
-            "📋 *የሚደገፉ ቅርጸቶች:* MP3, OGG, WAV, M4A, WebM, FLAC\n"
-            "⏱️ *የሚመከር:* ከ60 ሰከንድ በታች ድምጽ\n"
-            "📦 *ከፍተኛ መጠን:* 10MB\n\n"
-            "ድምጽዎን ይላኩ እና እኔ የተቀረውን አደርጋለሁ!"
-        ),
-        "help": (
-            "📖 *ይህን ቦት እንዴት መጠቀም እንደሚቻል:*\n\n"
-            "1. የድምጽ መልእክት ይላኩ\n"
-            "2. ወይም የድምጽ ፋይል ይላኩ\n"
-            "3. ግልባጩን ይጠብቁ\n\n"
-            "*📋 ትዕዛዞች:*\n"
-            "🗣️ /language - ቋንቋ ይቀይሩ\n"
-            "⚙️ /menu - ምናሌ ክፈት\n"
-            "📜 /history - የቅርብ ጊዜ ግልባጮች\n"
-            "📊 /settings - ቅንብሮቼን ይመልከቱ\n\n"
-            "⚠️ *ምክሮች:*\n"
-            "• ለተሻለ ውጤት በግልጽ ይናገሩ\n"
-            "• የጀርባ ድምጽን ይቀንሱ\n"
-            "• ድምጽ ከ60 ሰከንድ በታች ያድርጉ"
-        ),
-        "choose_language": "🌍 ቋንቋ ይምረጡ / Choose language:",
-        "language_set": "✅ ቋንቋ ወደ አማርኛ ተቀይሯል",
-        "processing": "🔄 ድምጽዎን በማስኬድ ላይ... እባክዎ ይጠብቁ።",
-        "transcription_success": "✅ *ግልባጭ:*\n\n",
-        "no_text_detected": "⚠️ ግልባጭ ተጠናቋል ግን ምንም ጽሑፍ አልተገኘም። እባክዎ በግልጽ ለመናገር ይሞክሩ።",
-        "error_failed": "❌ ግልባጭ አልተሳካም: ",
-        "error_timeout": "❌ ጊዜው አልፏል። እባክዎ በአጭር ድምጽ እንደገና ይሞክሩ።",
-        "error_generic": "❌ ድምጽዎን በማስኬድ ላይ ስህተት ተፈጥሯል። እባክዎ እንደገና ይሞክሩ።",
-        "error_no_audio": "❌ እባክዎ የድምጽ መልእክት ወይም የድምጽ ፋይል ይላኩ።",
-        "error_file_too_large": "❌ ፋይሉ በጣም ትልቅ ነው ({size}MB)። ከፍተኛው መጠን {max}MB ነው።",
-        "warning_long_audio": "⚠️ ድምጽ {duration} ሰከንድ ነው። ለተሻለ ውጤት ከ{max} ሰከንድ በታች ያድርጉ።\nቢሆንም በማስኬድ ላይ...",
-        # Menu strings
-        "menu_title": "⚙️ *ምናሌ*\n\nከዚህ በታች ያሉትን አማራጮች ይምረጡ:",
-        "menu_language": "🌍 ቋንቋ ቀይር",
-        "menu_settings": "📊 ቅንብሮቼ",
-        "menu_help": "❓ እርዳታ",
-        "menu_history": "📜 ታሪክ",
-        "menu_back": "◀️ ተመለስ",
-        "menu_close": "✖️ ዝጋ",
-        # Settings strings
-        "settings_title": "📊 *የእርስዎ ቅንብሮች*\n\n",
-        "settings_language": "🌍 *ቋንቋ:* {language}\n",
-        "settings_transcriptions": "📝 *ጠቅላላ ግልባጮች:* {count}\n",
-        "settings_since": "📅 *ከ:* {date}",
-        # History strings
-        "history_title": "📜 *የቅርብ ጊዜ ግልባጮች*\n\n",
-        "history_empty": "📭 ገና ምንም ግልባጭ የለዎትም።\n\nድምጽ ይላኩልኝ እና እኔ ወደ ጽሑፍ እቀይረዋለሁ!",
-        "history_item": "*{num}.* {date}\n_{preview}_\n\n",
-        "history_view": "👁️ ሙሉ ይመልከቱ #{num}",
-        "history_full": "📜 *ግልባጭ #{num}*\n📅 {date}\n\n{text}",
-        "history_no_item": "❌ ይህ ግልባጭ አልተገኘም።",
-        "menu_opened": "📋 ምናሌ ተከፍቷል",
-    },
-    "en": {
-        "welcome": (
-            "🎤 *Welcome to Fidel Scribe Bot!*\n\n"
-            "Send me a voice message or audio file, and I'll transcribe it to text.\n\n"
-            "📋 *Supported formats:* MP3, OGG, WAV, M4A, WebM, FLAC\n"
-            "⏱️ *Recommended:* Audio under 60 seconds\n"
-            "📦 *Max size:* 10MB\n\n"
-            "Just send your audio and I'll do the rest!"
-        ),
-        "help": (
-            "📖 *How to use this bot:*\n\n"
-            "1. Send a voice message\n"
-            "2. Or send an audio file\n"
-            "3. Wait for the transcription\n\n"
-            "*📋 Commands:*\n"
-            "🗣️ /language - Change language\n"
-            "⚙️ /menu - Open menu\n"
-            "📜 /history - Recent transcriptions\n"
-            "📊 /settings - View your settings\n\n"
-            "⚠️ *Tips:*\n"
-            "• Speak clearly for better results\n"
-            "• Minimize background noise\n"
-            "• Keep audio under 60 seconds"
-        ),
-        "choose_language": "🌍 ቋንቋ ይምረጡ / Choose language:",
-        "language_set": "✅ Language set to English",
-        "processing": "🔄 Processing your audio... Please wait.",
-        "transcription_success": "✅ *Transcription:*\n\n",
-        "no_text_detected": "⚠️ Transcription completed but no text was detected. Please try speaking more clearly.",
-        "error_failed": "❌ Transcription failed: ",
-        "error_timeout": "❌ Request timed out. Please try again with shorter audio.",
-        "error_generic": "❌ An error occurred while processing your audio. Please try again.",
-        "error_no_audio": "❌ Please send a voice message or audio file.",
-        "error_file_too_large": "❌ File too large ({size}MB). Maximum size is {max}MB.",
-        "warning_long_audio": "⚠️ Audio is {duration}s long. For best results, keep it under {max}s.\nProcessing anyway...",
-        # Menu strings
-        "menu_title": "⚙️ *Menu*\n\nSelect an option below:",
-        "menu_language": "🌍 Change Language",
-        "menu_settings": "📊 My Settings",
-        "menu_help": "❓ Help",
-        "menu_history": "📜 History",
-        "menu_back": "◀️ Back",
-        "menu_close": "✖️ Close",
-        # Settings strings
-        "settings_title": "📊 *Your Settings*\n\n",
-        "settings_language": "🌍 *Language:* {language}\n",
-        "settings_transcriptions": "📝 *Total transcriptions:* {count}\n",
-        "settings_since": "📅 *Since:* {date}",
-        # History strings
-        "history_title": "📜 *Recent Transcriptions*\n\n",
-        "history_empty": "📭 You don't have any transcriptions yet.\n\nSend me audio and I'll transcribe it for you!",
-        "history_item": "*{num}.* {date}\n_{preview}_\n\n",
-        "history_view": "👁️ View Full #{num}",
-        "history_full": "📜 *Transcription #{num}*\n📅 {date}\n\n{text}",
-        "history_no_item": "❌ This transcription was not found.",
-        "menu_opened": "📋 Menu opened",
-    },
-}
-
-DEFAULT_LANGUAGE = "am"
-
-
-def get_user_language(context: ContextTypes.DEFAULT_TYPE) -> str:
-    """Get user's preferred language from context."""
-    return context.user_data.get("language", DEFAULT_LANGUAGE)
-
-
-def get_string(key: str, context: ContextTypes.DEFAULT_TYPE, **kwargs) -> str:
-    """Get localized string for user's language."""
-    lang = get_user_language(context)
-    text = STRINGS.get(lang, STRINGS[DEFAULT_LANGUAGE]).get(key, STRINGS[DEFAULT_LANGUAGE][key])
-    if kwargs:
-        text = text.format(**kwargs)
-    return text
+# Language selection buttons (static, so built once)
+LANG_BUTTONS = [
+    InlineKeyboardButton(
+        f"{LANGUAGES[lang]['flag']} {LANGUAGES[lang]['name_native']}",
+        callback_data=f"lang_{lang}"
+    )
+    for lang in ("am", "en")
+]
+LANG_KEYBOARD = InlineKeyboardMarkup([LANG_BUTTONS])
+
+# Localized keyboards that are identical for every user of a language
+_menu_keyboards: dict[str, InlineKeyboardMarkup] = {}
+_back_buttons: dict[tuple[str, str], InlineKeyboardButton] = {}
+_back_keyboards: dict[tuple[str, str], InlineKeyboardMarkup] = {}
 
 
 def add_to_history(context: ContextTypes.DEFAULT_TYPE, transcription: str) -> None:
@@ -227,21 +110,47 @@ def get_history(context: ContextTypes.DEFAULT_TYPE) -> list:
 
 
 def create_menu_keyboard(context: ContextTypes.DEFAULT_TYPE) -> InlineKeyboardMarkup:
-    """Create the main menu inline keyboard."""
-    keyboard = [
-        [
-            InlineKeyboardButton(get_string("menu_language", context), callback_data="menu_language"),
-            InlineKeyboardButton(get_string("menu_settings", context), callback_data="menu_settings"),
-        ],
-        [
-            InlineKeyboardButton(get_string("menu_history", context), callback_data="menu_history"),
-            InlineKeyboardButton(get_string("menu_help", context), callback_data="menu_help"),
-        ],
-        [
-            InlineKeyboardButton(get_string("menu_close", context), callback_data="menu_close"),
-        ],
-    ]
-    return InlineKeyboardMarkup(keyboard)
+    """Create the main menu inline keyboard (built once per language)."""
+    lang = get_user_language(context)
+    markup = _menu_keyboards.get(lang)
+    if markup is None:
+        keyboard = [
+            [
+                InlineKeyboardButton(get_string("menu_language", context), callback_data="menu_language"),
+                InlineKeyboardButton(get_string("menu_settings", context), callback_data="menu_settings"),
+            ],
+            [
+                InlineKeyboardButton(get_string("menu_history", context), callback_data="menu_history"),
+                InlineKeyboardButton(get_string("menu_help", context), callback_data="menu_help"),
+            ],
+            [
+                InlineKeyboardButton(get_string("menu_close", context), callback_data="menu_close"),
+            ],
+        ]
+        markup = _menu_keyboards[lang] = InlineKeyboardMarkup(keyboard)
+    return markup
+
+
+def create_back_button(context: ContextTypes.DEFAULT_TYPE, callback_data: str = "menu_back") -> InlineKeyboardButton:
+    """Create the localized Back button (built once per language and target)."""
+    cache_key = (get_user_language(context), callback_data)
+    button = _back_buttons.get(cache_key)
+    if button is None:
+        button = _back_buttons[cache_key] = InlineKeyboardButton(
+            get_string("menu_back", context), callback_data=callback_data
+        )
+    return button
+
+
+def create_back_keyboard(context: ContextTypes.DEFAULT_TYPE, callback_data: str = "menu_back") -> InlineKeyboardMarkup:
+    """Create a single Back button keyboard (built once per language and target)."""
+    cache_key = (get_user_language(context), callback_data)
+    markup = _back_keyboards.get(cache_key)
+    if markup is None:
+        markup = _back_keyboards[cache_key] = InlineKeyboardMarkup(
+            [[create_back_button(context, callback_data)]]
+        )
+    return markup
 
 
 def create_history_keyboard(context: ContextTypes.DEFAULT_TYPE, history: list) -> InlineKeyboardMarkup:
@@ -254,84 +163,16 @@ def create_history_keyboard(context: ContextTypes.DEFAULT_TYPE, history: list) -
                 callback_data=f"history_view_{i}"
             )
         ])
-    keyboard.append([
-        InlineKeyboardButton(get_string("menu_back", context), callback_data="menu_back")
-    ])
+    keyboard.append([create_back_button(context)])
     return InlineKeyboardMarkup(keyboard)
 
 
-async def exponential_backoff_retry(
-    func,
-    *args,
-    max_retries: int = MAX_RETRIES,
-    base_delay: float = BASE_DELAY,
-    **kwargs,
-) -> Optional[httpx.Response]:
-    """Execute function with exponential backoff retry logic."""
-    for attempt in range(max_retries):
-        try:
-            return await func(*args, **kwargs)
-        except (httpx.RequestError, httpx.TimeoutException) as e:
-            if attempt == max_retries - 1:
-                raise e
-            delay = base_delay * (2 ** attempt) + random.uniform(0, 1)
-            logger.warning(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay:.2f}s...")
-            await asyncio.sleep(delay)
-    return None
-
-
-async def transcribe_audio(audio_data: bytes, language_code: str = "am-ET") -> dict:
-    """Send audio to the Speech-to-Text API and return the response."""
-    # Encode audio to base64
-    audio_base64 = base64.b64encode(audio_data).decode("utf-8")
-
-    # Prepare request payload
-    payload = {
-        "audioData": audio_base64,
-        "language": language_code,
-    }
-    
-    async with httpx.AsyncClient(timeout=60.0) as client:
-        response = await exponential_backoff_retry(
-            client.post,
-            API_URL,
-            json=payload,
-            headers={"Content-Type": "application/json"},
-        )
-        
-        if response is None:
-            return {"success": False, "error": "Failed to connect to API after retries"}
-        
-        if response.status_code == 200:
-            return response.json()
-        elif response.status_code == 400:
-            error_data = response.json()
-            return {"success": False, "error": error_data.get("error", "Bad request")}
-        elif response.status_code == 500:
-            error_data = response.json()
-            return {"success": False, "error": error_data.get("error", "Server error")}
-        else:
-            return {"success": False, "error": f"Unexpected status code: {response.status_code}"}
-
-
 async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /start command."""
     # Show language selection on first start
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                f"{LANGUAGES['am']['flag']} {LANGUAGES['am']['name_native']}",
-                callback_data="lang_am"
-            ),
-            InlineKeyboardButton(
-                f"{LANGUAGES['en']['flag']} {LANGUAGES['en']['name_native']}",
-                callback_data="lang_en"
-            ),
-        ]
-    ]
     await update.message.reply_text(
         get_string("choose_language", context),
-        reply_markup=InlineKeyboardMarkup(keyboard)
+        reply_markup=LANG_KEYBOARD
     )
 
 
@@ -345,21 +186,9 @@ async def help_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
 
 async def language_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle the /language command."""
-    keyboard = [
-        [
-            InlineKeyboardButton(
-                f"{LANGUAGES['am']['flag']} {LANGUAGES['am']['name_native']}",
-                callback_data="lang_am"
-            ),
-            InlineKeyboardButton(
-                f"{LANGUAGES['en']['flag']} {LANGUAGES['en']['name_native']}",
-                callback_data="lang_en"
-            ),
-        ]
-    ]
     await update.message.reply_text(
         get_string("choose_language", context),
-        reply_markup=InlineKeyboardMarkup(keyboard)
+        reply_markup=LANG_KEYBOARD
     )
 
 
@@ -410,11 +239,11 @@ async def settings_command(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     settings_text += get_string("settings_transcriptions", context, count=total)
     settings_text += get_string("settings_since", context, date=first_use)
 
-    keyboard = [[InlineKeyboardButton(get_string("menu_back", context), callback_data="menu_main")]]
+    keyboard = create_back_keyboard(context, "menu_main")
 
     await update.message.reply_text(
         settings_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=keyboard,
         parse_mode="Markdown"
     )
 
@@ -446,17 +275,8 @@ async def handle_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYP
     if action == "menu_language":
         # Show language selection
         keyboard = [
-            [
-                InlineKeyboardButton(
-                    f"{LANGUAGES['am']['flag']} {LANGUAGES['am']['name_native']}",
-                    callback_data="lang_am"
-                ),
-                InlineKeyboardButton(
-                    f"{LANGUAGES['en']['flag']} {LANGUAGES['en']['name_native']}",
-                    callback_data="lang_en"
-                ),
-            ],
-            [InlineKeyboardButton(get_string("menu_back", context), callback_data="menu_back")]
+            LANG_BUTTONS,
+            [create_back_button(context)]
         ]
         await query.edit_message_text(
             get_string("choose_language", context),
@@ -475,10 +295,10 @@ async def handle_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYP
         settings_text += get_string("settings_transcriptions", context, count=total)
         settings_text += get_string("settings_since", context, date=first_use)
 
-        keyboard = [[InlineKeyboardButton(get_string("menu_back", context), callback_data="menu_back")]]
+        keyboard = create_back_keyboard(context)
         await query.edit_message_text(
             settings_text,
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=keyboard,
             parse_mode="Markdown"
         )
 
@@ -487,10 +307,10 @@ async def handle_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYP
         history = get_history(context)
 
         if not history:
-            keyboard = [[InlineKeyboardButton(get_string("menu_back", context), callback_data="menu_back")]]
+            keyboard = create_back_keyboard(context)
             await query.edit_message_text(
                 get_string("history_empty", context),
-                reply_markup=InlineKeyboardMarkup(keyboard),
+                reply_markup=keyboard,
                 parse_mode="Markdown"
             )
             return
@@ -510,10 +330,10 @@ async def handle_menu_callback(update: Update, context: ContextTypes.DEFAULT_TYP
 
     elif action == "menu_help":
         # Show help
-        keyboard = [[InlineKeyboardButton(get_string("menu_back", context), callback_data="menu_back")]]
+        keyboard = create_back_keyboard(context)
         await query.edit_message_text(
             get_string("help", context),
-            reply_markup=InlineKeyboardMarkup(keyboard),
+            reply_markup=keyboard,
             parse_mode="Markdown"
         )
 
@@ -544,10 +364,10 @@ async def handle_history_callback(update: Update, context: ContextTypes.DEFAULT_
     history = get_history(context)
 
     if item_num < 1 or item_num > len(history):
-        keyboard = [[InlineKeyboardButton(get_string("menu_back", context), callback_data="menu_history")]]
+        keyboard = create_back_keyboard(context, "menu_history")
         await query.edit_message_text(
             get_string("history_no_item", context),
-            reply_markup=InlineKeyboardMarkup(keyboard)
+            reply_markup=keyboard
         )
         return
 
@@ -559,20 +379,25 @@ async def handle_history_callback(update: Update, context: ContextTypes.DEFAULT_
         text=item["text"]
     )
 
-    keyboard = [[InlineKeyboardButton(get_string("menu_back", context), callback_data="menu_history")]]
+    keyboard = create_back_keyboard(context, "menu_history")
     await query.edit_message_text(
         full_text,
-        reply_markup=InlineKeyboardMarkup(keyboard),
+        reply_markup=keyboard,
         parse_mode="Markdown"
     )
 
 
+@lru_cache(maxsize=512)
+def _search_urls(text: str) -> tuple[str, str]:
+    """Return the Google and YouTube search URLs for text."""
+    query_text = quote_plus(text)
+    return GOOGLE_SEARCH_URL + query_text, YOUTUBE_SEARCH_URL + query_text
+
+
 def create_transcription_keyboard(transcription: str, context: ContextTypes.DEFAULT_TYPE) -> InlineKeyboardMarkup:
     """Create inline keyboard with YouTube, Google, and text buttons."""
     # URL-encode the transcription for searches
-    query_text = quote_plus(transcription[:100])  # Limit query length
-    youtube_url = f"https://www.youtube.com/results?search_query={query_text}"
-    google_url = f"https://www.google.com/search?q={query_text}"
+    google_url, youtube_url = _search_urls(transcription[:SEARCH_QUERY_LENGTH])
 
     # Clean, minimal buttons - just search options
     keyboard = [
@@ -584,6 +409,55 @@ def create_transcription_keyboard(transcription: str, context: ContextTypes.DEFA
     return InlineKeyboardMarkup(keyboard)
 
 
+async def _download_range(url: str, buffer: bytearray, start: int, end: int) -> None:
+    """Fetch bytes start..end (inclusive) of url into buffer."""
+    headers = {"Range": f"bytes={start}-{end}"}
+    async with download_client.stream("GET", url, headers=headers) as response:
+        # Check before reading so a server that ignores Range doesn't send the whole file
+        if response.status_code != 206:
+            raise ValueError(f"Range request returned {response.status_code}")
+        offset = start
+        async for chunk in response.aiter_bytes():
+            if offset + len(chunk) > end + 1:
+                raise ValueError("Range response is longer than requested")
+            buffer[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+    if offset != end + 1:
+        raise ValueError("Range response is shorter than requested")
+
+
+async def download_audio(file: File) -> bytearray:
+    """Download a Telegram file, fetching large files as parallel byte ranges."""
+    size = file.file_size
+    if not size or size <= PARALLEL_DOWNLOAD_THRESHOLD or not file.file_path.startswith("https://"):
+        return await file.download_as_bytearray()
+
+    buffer = bytearray(size)
+    part_size = -(-size // DOWNLOAD_PARTS)
+    tasks = [
+        asyncio.create_task(
+            _download_range(file.file_path, buffer, start, min(start + part_size, size) - 1)
+        )
+        for start in range(0, size, part_size)
+    ]
+    error = None
+    try:
+        await asyncio.gather(*tasks)
+    except (httpx.HTTPError, ValueError) as e:
+        error = e
+    finally:
+        # Stop any range requests still running after a failure
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    if error is None:
+        return buffer
+    # Don't log the exception itself: its message contains the bot token URL
+    logger.warning("Parallel download failed (%s), retrying as a single request", type(error).__name__)
+    return await file.download_as_bytearray()
+
+
 async def handle_audio(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     """Handle incoming audio messages (voice messages and audio files)."""
     message = update.message
@@ -619,18 +493,25 @@ async def handle_audio(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
     processing_msg = await message.reply_text(get_string("processing", context))
 
     try:
-        # Download the audio file
-        file = await context.bot.get_file(audio_file.file_id)
-        audio_data = await file.download_as_bytearray()
-
-        logger.info(f"Downloaded {file_type}: {len(audio_data)} bytes")
-
-        # Get user's language code for transcription
-        user_lang = get_user_language(context)
-        language_code = LANGUAGES.get(user_lang, LANGUAGES[DEFAULT_LANGUAGE])["code"]
-
-        # Transcribe the audio
-        result = await transcribe_audio(bytes(audio_data), language_code)
+        # Bound how many files one user can have in flight at a time
+        user_id = update.effective_user.id
+        user_semaphore = user_semaphores.get(user_id)
+        if user_semaphore is None:
+            user_semaphore = user_semaphores[user_id] = asyncio.Semaphore(MAX_CONCURRENT_PER_USER)
+        async with user_semaphore:
+            # Download the audio file
+            file = await context.bot.get_file(audio_file.file_id)
+            audio_data = await download_audio(file)
+
+            logger.info("Downloaded %s: %d bytes", file_type, len(audio_data))
+
+            # Get user's language code for transcription
+            user_lang = get_user_language(context)
+            language_code = LANGUAGES.get(user_lang, LANGUAGES[DEFAULT_LANGUAGE])["code"]
+
+            # Transcribe the audio (the bytearray is passed as-is to avoid a copy)
+            async with transcription_semaphore:
+                result = await transcribe_audio(audio_data, language_code)
 
         # Handle the response
         if result.get("success"):
@@ -651,14 +532,14 @@ async def handle_audio(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
         else:
             error_msg = result.get("error", "Unknown error occurred")
             await processing_msg.edit_text(f"{get_string('error_failed', context)}{error_msg}")
-            logger.error(f"Transcription error: {error_msg}")
+            logger.error("Transcription error: %s", error_msg)
 
     except httpx.TimeoutException:
         await processing_msg.edit_text(get_string("error_timeout", context))
         logger.error("API request timed out")
     except Exception as e:
         await processing_msg.edit_text(get_string("error_generic", context))
-        logger.error(f"Error processing audio: {e}")
+        logger.error("Error processing audio: %s", e)
 
 
 async def post_init(application: Application) -> None:
@@ -667,17 +548,31 @@ async def post_init(application: Application) -> None:
     logger.info("Webhook deleted, ready for polling")
 
 
+async def post_shutdown(application: Application) -> None:
+    """Close the shared HTTP clients."""
+    await http_client.aclose()
+    await download_client.aclose()
+
+
 def main() -> None:
     """Main function to start the bot."""
     if not TELEGRAM_BOT_TOKEN:
         logger.error("TELEGRAM_BOT_TOKEN environment variable is not set!")
         return
 
-    # Create application with post_init to clear webhooks
+    # Use uvloop's faster event loop (not available on Windows)
+    if sys.platform != "win32":
+        import uvloop
+        uvloop.install()
+
+    # Create application with post_init to clear webhooks. Updates are handled
+    # concurrently so one slow transcription doesn't hold up other users.
     application = (
         Application.builder()
         .token(TELEGRAM_BOT_TOKEN)
         .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .concurrent_updates(True)
         .build()
     )
 
@@ -0,0 +1,3 @@
+"""
+Shared modules for Fidel Scribe Bot.
+"""
@@ -0,0 +1,134 @@
+"""
+Client for the AWS Lambda Speech-to-Text API.
+"""
+
+import asyncio
+import base64
+import json
+import logging
+import random
+from typing import AsyncIterator, Optional
+
+import httpx
+import orjson
+
+from fidelscribe.i18n import LANGUAGES
+
+logger = logging.getLogger(__name__)
+
+# Configuration
+API_URL = "https://5pinlu85tk.execute-api.us-east-1.amazonaws.com/api/v1/speech-to-text"
+
+# Retry configuration
+MAX_RETRIES = 3
+BASE_DELAY = 1  # seconds
+MAX_DELAY = 30  # seconds, cap for the backoff window
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Request body streaming (multiple of 3 so only the final chunk is padded)
+PAYLOAD_CHUNK_SIZE = 57 * 1024
+
+# Shared HTTP client (reused across requests to keep connections alive).
+# HTTP/2 lets concurrent transcriptions share one connection to API Gateway.
+http_client = httpx.AsyncClient(
+    timeout=httpx.Timeout(60.0, connect=10.0),
+    limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+    http2=True,
+)
+
+# Pre-encoded JSON around the streamed base64 audio. Base64 output never needs
+# escaping, so the request body is assembled from bytes without a JSON encoder.
+# The Lambda behind API_URL only accepts this JSON shape; sending raw audio
+# would need a binary media type and a handler change on the API side first.
+PAYLOAD_PREFIX = b'{"audioData":"'
+_PAYLOAD_SUFFIXES = {
+    lang["code"]: b'","language":' + json.dumps(lang["code"]).encode() + b'}'
+    for lang in LANGUAGES.values()
+}
+
+
+async def exponential_backoff_retry(
+    func,
+    *args,
+    max_retries: int = MAX_RETRIES,
+    base_delay: float = BASE_DELAY,
+    **kwargs,
+) -> Optional[httpx.Response]:
+    """Execute function with exponential backoff retry logic.
+
+    Uses full jitter so bursts of failing requests don't retry in lockstep.
+    Responses with a retryable status code are retried as well; the last one
+    is returned so the caller can report the API's error.
+    """
+    for attempt in range(max_retries):
+        try:
+            response = await func(*args, **kwargs)
+        except (httpx.RequestError, httpx.TimeoutException) as e:
+            if attempt == max_retries - 1:
+                raise
+            error = e
+        else:
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == max_retries - 1:
+                return response
+            error = f"HTTP {response.status_code}"
+        delay = random.uniform(0, min(base_delay * (2 ** attempt), MAX_DELAY))
+        logger.warning("Attempt %d failed: %s. Retrying in %.2fs...", attempt + 1, error, delay)
+        await asyncio.sleep(delay)
+    return None
+
+
+def _payload_suffix(language_code: str) -> bytes:
+    """Return the JSON suffix that follows the base64 audio."""
+    suffix = _PAYLOAD_SUFFIXES.get(language_code)
+    if suffix is None:
+        suffix = b'","language":' + json.dumps(language_code).encode() + b'}'
+    return suffix
+
+
+async def _iter_payload(audio_data: bytes, language_code: str) -> AsyncIterator[bytes]:
+    """Yield the JSON request body, base64-encoding the audio chunk by chunk."""
+    yield PAYLOAD_PREFIX
+    # Slicing a memoryview hands each chunk to the encoder without copying it
+    view = memoryview(audio_data)
+    for i in range(0, len(view), PAYLOAD_CHUNK_SIZE):
+        yield base64.b64encode(view[i:i + PAYLOAD_CHUNK_SIZE])
+    yield _payload_suffix(language_code)
+
+
+def _payload_length(audio_data: bytes, language_code: str) -> int:
+    """Return the byte length of the body produced by _iter_payload."""
+    encoded_length = 4 * ((len(audio_data) + 2) // 3)
+    return len(PAYLOAD_PREFIX) + encoded_length + len(_payload_suffix(language_code))
+
+
+async def transcribe_audio(audio_data: bytes, language_code: str = "am-ET") -> dict:
+    """Send audio to the Speech-to-Text API and return the response."""
+    async def send_request() -> httpx.Response:
+        # A streamed body can only be consumed once, so build it per attempt
+        return await http_client.post(
+            API_URL,
+            content=_iter_payload(audio_data, language_code),
+            # An explicit length keeps httpx from falling back to chunked encoding
+            headers={
+                "Content-Type": "application/json",
+                "Content-Length": str(_payload_length(audio_data, language_code)),
+            },
+        )
+
+    response = await exponential_backoff_retry(send_request)
+
+    if response is None:
+        return {"success": False, "error": "Failed to connect to API after retries"}
+
+    logger.debug("API responded with %d over %s", response.status_code, response.http_version)
+
+    status = response.status_code
+    if status == 200:
+        return orjson.loads(response.content)
+
+    # Error bodies may be missing or not JSON (e.g. API Gateway errors)
+    try:
+        error = orjson.loads(response.content).get("error")
+    except (orjson.JSONDecodeError, AttributeError):
+        error = None
+    return {"success": False, "error": error or f"HTTP {status}"}
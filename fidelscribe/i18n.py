@@ -0,0 +1,156 @@
+"""
+Localized UI strings and language settings for Fidel Scribe Bot.
+"""
+
+from telegram.ext import ContextTypes
+
+# Language configurations
+LANGUAGES = {
+    "am": {
+        "code": "am-ET",
+        "flag": "🇪🇹",
+        "name_en": "Amharic",
+        "name_native": "አማርኛ",
+    },
+    "en": {
+        "code": "en-US",
+        "flag": "🇺🇸",
+        "name_en": "English",
+        "name_native": "English",
+    },
+}
+
+# UI Strings for both languages
+STRINGS = {
+    "am": {
+        "welcome": (
+            "🎤 *ወደ ፊደል ስክራይብ ቦት እንኳን በደህና መጡ!*\n\n"
+            "የድምጽ መልእክት ወይም የድምጽ ፋይል ይላኩልኝ፣ ወደ ጽሑፍ እቀይረዋለሁ።\n\n"
+            "📋 *የሚደገፉ ቅርጸቶች:* MP3, OGG, WAV, M4A, WebM, FLAC\n"
+            "⏱️ *የሚመከር:* ከ60 ሰከንድ በታች ድምጽ\n"
+            "📦 *ከፍተኛ መጠን:* 10MB\n\n"
+            "ድምጽዎን ይላኩ እና እኔ የተቀረውን አደርጋለሁ!"
+        ),
+        "help": (
+            "📖 *ይህን ቦት እንዴት መጠቀም እንደሚቻል:*\n\n"
+            "1. የድምጽ መልእክት ይላኩ\n"
+            "2. ወይም የድምጽ ፋይል ይላኩ\n"
+            "3. ግልባጩን ይጠብቁ\n\n"
+            "*📋 ትዕዛዞች:*\n"
+            "🗣️ /language - ቋንቋ ይቀይሩ\n"
+            "⚙️ /menu - ምናሌ ክፈት\n"
+            "📜 /history - የቅርብ ጊዜ ግልባጮች\n"
+            "📊 /settings - ቅንብሮቼን ይመልከቱ\n\n"
+            "⚠️ *ምክሮች:*\n"
+            "• ለተሻለ ውጤት በግልጽ ይናገሩ\n"
+            "• የጀርባ ድምጽን ይቀንሱ\n"
+            "• ድምጽ ከ60 ሰከንድ በታች ያድርጉ"
+        ),
+        "choose_language": "🌍 ቋንቋ ይምረጡ / Choose language:",
+        "language_set": "✅ ቋንቋ ወደ አማርኛ ተቀይሯል",
+        "processing": "🔄 ድምጽዎን በማስኬድ ላይ... እባክዎ ይጠብቁ።",
+        "transcription_success": "✅ *ግልባጭ:*\n\n",
+        "no_text_detected": "⚠️ ግልባጭ ተጠናቋል ግን ምንም ጽሑፍ አልተገኘም። እባክዎ በግልጽ ለመናገር ይሞክሩ።",
+        "error_failed": "❌ ግልባጭ አልተሳካም: ",
+        "error_timeout": "❌ ጊዜው አልፏል። እባክዎ በአጭር ድምጽ እንደገና ይሞክሩ።",
+        "error_generic": "❌ ድምጽዎን በማስኬድ ላይ ስህተት ተፈጥሯል። እባክዎ እንደገና ይሞክሩ።",
+        "error_no_audio": "❌ እባክዎ የድምጽ መልእክት ወይም የድምጽ ፋይል ይላኩ።",
+        "error_file_too_large": "❌ ፋይሉ በጣም ትልቅ ነው ({size}MB)። ከፍተኛው መጠን {max}MB ነው።",
+        "warning_long_audio": "⚠️ ድምጽ {duration} ሰከንድ ነው። ለተሻለ ውጤት ከ{max} ሰከንድ በታች ያድርጉ።\nቢሆንም በማስኬድ ላይ...",
+        # Menu strings
+        "menu_title": "⚙️ *ምናሌ*\n\nከዚህ በታች ያሉትን አማራጮች ይምረጡ:",
+        "menu_language": "🌍 ቋንቋ ቀይር",
+        "menu_settings": "📊 ቅንብሮቼ",
+        "menu_help": "❓ እርዳታ",
+        "menu_history": "📜 ታሪክ",
+        "menu_back": "◀️ ተመለስ",
+        "menu_close": "✖️ ዝጋ",
+        # Settings strings
+        "settings_title": "📊 *የእርስዎ ቅንብሮች*\n\n",
+        "settings_language": "🌍 *ቋንቋ:* {language}\n",
+        "settings_transcriptions": "📝 *ጠቅላላ ግልባጮች:* {count}\n",
+        "settings_since": "📅 *ከ:* {date}",
+        # History strings
+        "history_title": "📜 *የቅርብ ጊዜ ግልባጮች*\n\n",
+        "history_empty": "📭 ገና ምንም ግልባጭ የለዎትም።\n\nድምጽ ይላኩልኝ እና እኔ ወደ ጽሑፍ እቀይረዋለሁ!",
+        "history_item": "*{num}.* {date}\n_{preview}_\n\n",
+        "history_view": "👁️ ሙሉ ይመልከቱ #{num}",
+        "history_full": "📜 *ግልባጭ #{num}*\n📅 {date}\n\n{text}",
+        "history_no_item": "❌ ይህ ግልባጭ አልተገኘም።",
+        "menu_opened": "📋 ምናሌ ተከፍቷል",
+    },
+    "en": {
+        "welcome": (
+            "🎤 *Welcome to Fidel Scribe Bot!*\n\n"
+            "Send me a voice message or audio file, and I'll transcribe it to text.\n\n"
+            "📋 *Supported formats:* MP3, OGG, WAV, M4A, WebM, FLAC\n"
+            "⏱️ *Recommended:* Audio under 60 seconds\n"
+            "📦 *Max size:* 10MB\n\n"
+            "Just send your audio and I'll do the rest!"
+        ),
+        "help": (
+            "📖 *How to use this bot:*\n\n"
+            "1. Send a voice message\n"
+            "2. Or send an audio file\n"
+            "3. Wait for the transcription\n\n"
+            "*📋 Commands:*\n"
+            "🗣️ /language - Change language\n"
+            "⚙️ /menu - Open menu\n"
+            "📜 /history - Recent transcriptions\n"
+            "📊 /settings - View your settings\n\n"
+            "⚠️ *Tips:*\n"
+            "• Speak clearly for better results\n"
+            "• Minimize background noise\n"
+            "• Keep audio under 60 seconds"
+        ),
+        "choose_language": "🌍 ቋንቋ ይምረጡ / Choose language:",
+        "language_set": "✅ Language set to English",
+        "processing": "🔄 Processing your audio... Please wait.",
+        "transcription_success": "✅ *Transcription:*\n\n",
+        "no_text_detected": "⚠️ Transcription completed but no text was detected. Please try speaking more clearly.",
+        "error_failed": "❌ Transcription failed: ",
+        "error_timeout": "❌ Request timed out. Please try again with shorter audio.",
+        "error_generic": "❌ An error occurred while processing your audio. Please try again.",
+        "error_no_audio": "❌ Please send a voice message or audio file.",
+        "error_file_too_large": "❌ File too large ({size}MB). Maximum size is {max}MB.",
+        "warning_long_audio": "⚠️ Audio is {duration}s long. For best results, keep it under {max}s.\nProcessing anyway...",
+        # Menu strings
+        "menu_title": "⚙️ *Menu*\n\nSelect an option below:",
+        "menu_language": "🌍 Change Language",
+        "menu_settings": "📊 My Settings",
+        "menu_help": "❓ Help",
+        "menu_history": "📜 History",
+        "menu_back": "◀️ Back",
+        "menu_close": "✖️ Close",
+        # Settings strings
+        "settings_title": "📊 *Your Settings*\n\n",
+        "settings_language": "🌍 *Language:* {language}\n",
+        "settings_transcriptions": "📝 *Total transcriptions:* {count}\n",
+        "settings_since": "📅 *Since:* {date}",
+        # History strings
+        "history_title": "📜 *Recent Transcriptions*\n\n",
+        "history_empty": "📭 You don't have any transcriptions yet.\n\nSend me audio and I'll transcribe it for you!",
+        "history_item": "*{num}.* {date}\n_{preview}_\n\n",
+        "history_view": "👁️ View Full #{num}",
+        "history_full": "📜 *Transcription #{num}*\n📅 {date}\n\n{text}",
+        "history_no_item": "❌ This transcription was not found.",
+        "menu_opened": "📋 Menu opened",
+    },
+}
+
+DEFAULT_LANGUAGE = "am"
+
+# Per-language string tables with missing keys already filled from the default
+_STRINGS = {lang: {**STRINGS[DEFAULT_LANGUAGE], **strings} for lang, strings in STRINGS.items()}
+
+
+def get_user_language(context: ContextTypes.DEFAULT_TYPE) -> str:
+    """Get user's preferred language from context."""
+    return context.user_data.get("language", DEFAULT_LANGUAGE)
+
+
+def get_string(key: str, context: ContextTypes.DEFAULT_TYPE, **kwargs) -> str:
+    """Get localized string for user's language."""
+    strings = _STRINGS.get(get_user_language(context)) or _STRINGS[DEFAULT_LANGUAGE]
+    text = strings[key]
+    return text.format(**kwargs) if kwargs else text